@@ -34,14 +34,15 @@ def is_database_initialized():
         
         db = next(get_db())
         try:
+            # EXISTS stops at the first row instead of counting whole tables
             checks = {
-                'students': db.query(StudentDB).count(),
-                'courses': db.query(CourseDB).count(),
-                'programs': db.query(ProgramDB).count(),
-                'sections': db.query(SectionDB).count(),
+                'students': db.query(db.query(StudentDB).exists()).scalar(),
+                'courses': db.query(db.query(CourseDB).exists()).scalar(),
+                'programs': db.query(db.query(ProgramDB).exists()).scalar(),
+                'sections': db.query(db.query(SectionDB).exists()).scalar(),
             }
             
-            is_initialized = all(count > 0 for count in checks.values())
+            is_initialized = all(checks.values())
             
             if is_initialized:
                 logger.info(f"Database already initialized: {checks}")
@@ -136,12 +137,13 @@ def initialize_database():
             db = next(get_db())
             try:
                 from Database.models import UserDB, SectionNameDB
-                user_count = db.query(UserDB).count()
-                section_name_count = db.query(SectionNameDB).count()
-                logger.info(f"Verification: users={user_count}, section_name={section_name_count}")
-                if user_count == 0:
+                # EXISTS only needs one row to tell an empty table from a loaded one
+                has_users = db.query(db.query(UserDB).exists()).scalar()
+                has_section_names = db.query(db.query(SectionNameDB).exists()).scalar()
+                logger.info(f"Verification: users={has_users}, section_name={has_section_names}")
+                if not has_users:
                     logger.warning("⚠️  WARNING: users table is empty after loading!")
-                if section_name_count == 0:
+                if not has_section_names:
                     logger.warning("⚠️  WARNING: section_name table is empty after loading!")
             except Exception as e:
                 logger.warning(f"Could not verify table counts: {e}")
@@ -29,7 +29,8 @@ engine = sql.create_engine(
     pool_pre_ping=True,      # Verify connections before using them
     pool_recycle=3600,       # Recycle connections after 1 hour
     pool_size=10,            # Connection pool size
-    max_overflow=20          # Max overflow connections
+    max_overflow=20,         # Max overflow connections
+    insertmanyvalues_page_size=10_000,  # Rows per multi-VALUES INSERT in executemany (default 1000)
 )
 Base = declarative.declarative_base()
 SessionLocal = orm.sessionmaker(autocommit=False, autoflush=False, bind=engine)
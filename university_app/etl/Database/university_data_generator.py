@@ -15,12 +15,13 @@ Generates data for:
 
 from faker import Faker
 import random
-from datetime import time
+from collections import Counter, defaultdict
+from itertools import cycle
 
 fake = Faker()
 
 # Provided course list
-COURSES = [
+COURSES = (
     "CS 100 Calculus 1",
     "CS 101 Calculus 2",
     "CS 102 Calculus 3",
@@ -72,10 +73,10 @@ COURSES = [
     "CSE 181 Creativity and Technological Innovation",
     "CSE 210 Historical Development of Mathematical Ideas",
     "CSE 222 Technology Marketing",
-]
+)
 
 # Program names (using shortcut names)
-PROGRAMS = [
+PROGRAMS = (
     "BAB",   # Bachelor of Arts in Business
     "BAEC",  # Bachelor of Arts in English and Communications
     "BAPG",  # Bachelor of Arts in Politics and Governance
@@ -85,19 +86,34 @@ PROGRAMS = [
     "BSN",   # Bachelor of Science in Nursing
     "BSESS", # Bachelor of Science in Environmental and Sustainability Sciences
     "BSE",   # Bachelor of Science in Economics
-]
+)
 
 # Foundation and General Education programs for courses available to all programs
 FND_PROGRAM = "FND"      # Foundation program (FND prefix courses)
 GENED_PROGRAM = "GENED"  # General Education program (CHSS, CSE courses)
 
 # Department names
-DEPARTMENTS = [
+DEPARTMENTS = (
     "Manoogian Simone College of Business and Economics",
     "Akian College of Science and Engineering",
     "College of Humanities and Social Sciences",
     "Turpanjian College of Health Sciences",
-]
+)
+
+# Department offering each program
+PROGRAM_TO_DEPT = {
+    "BAB": "Manoogian Simone College of Business and Economics",
+    "BAEC": "College of Humanities and Social Sciences",
+    "BAPG": "College of Humanities and Social Sciences",
+    "BSCS": "Akian College of Science and Engineering",
+    "BSDS": "Akian College of Science and Engineering",
+    "BSES": "Akian College of Science and Engineering",
+    "BSN": "Turpanjian College of Health Sciences",
+    "BSESS": "Akian College of Science and Engineering",
+    "BSE": "Manoogian Simone College of Business and Economics",
+    FND_PROGRAM: "College of Humanities and Social Sciences",    # Foundation program
+    GENED_PROGRAM: "College of Humanities and Social Sciences",  # General Education program
+}
 
 # Mapping course prefixes to programs (using actual program names: BSDS, FND, GENED)
 COURSE_PREFIX_TO_PROGRAM = {
@@ -112,33 +128,33 @@ COURSE_PREFIX_TO_PROGRAM = {
 
 # Course groupings for instructor assignment
 COURSE_GROUPS = {
-    "Calculus": ["CS 100 Calculus 1", "CS 101 Calculus 2", "CS 102 Calculus 3"],
-    "Probability_Statistics": ["CS 107 Probability", "CS 108 Statistics 1", "DS 110 Statistics 2"],
-    "Numerical_Linear": ["ENGS 211 Numerical Methods", "CS 104 Linear Algebra"],
-    "Discrete_Math": ["CS 111 Discrete Math"],
-    "Intro_CS": ["CS 110 Intro to Computer Science", "CSE 110 Introduction to Computer Science"],
-    "Data_Science_Programming": ["DS 120 Programming for Data Science"],
-    "Data_Structures_Algorithms": ["DS 115 Data Structures / Algorithms for Data Science"],
-    "Databases": ["DS 205 Databases and Distributed Systems"],
-    "AI_ML": ["CS 246 Artificial Intelligence", "CS 251 Machine Learning"],
-    "Business_Analytics": [
+    "Calculus": ("CS 100 Calculus 1", "CS 101 Calculus 2", "CS 102 Calculus 3"),
+    "Probability_Statistics": ("CS 107 Probability", "CS 108 Statistics 1", "DS 110 Statistics 2"),
+    "Numerical_Linear": ("ENGS 211 Numerical Methods", "CS 104 Linear Algebra"),
+    "Discrete_Math": ("CS 111 Discrete Math",),
+    "Intro_CS": ("CS 110 Intro to Computer Science", "CSE 110 Introduction to Computer Science"),
+    "Data_Science_Programming": ("DS 120 Programming for Data Science",),
+    "Data_Structures_Algorithms": ("DS 115 Data Structures / Algorithms for Data Science",),
+    "Databases": ("DS 205 Databases and Distributed Systems",),
+    "AI_ML": ("CS 246 Artificial Intelligence", "CS 251 Machine Learning"),
+    "Business_Analytics": (
         "BUS 101 Introduction to Business",
         "DS 227 Business Analytics for Data Science",
         "DS 206 Business Intelligence",
         "DS 223 Marketing Analytics",
         "DS 207 Time Series Forecasting",
         "CSE 222 Technology Marketing",
-    ],
-    "Biology_Life_Sciences": [
+    ),
+    "Biology_Life_Sciences": (
         "DS 150 Physics & Chemistry in Life Sciences",
         "DS 151 Cell & Molecular Biology",
         "DS 211 Intro to Bioinformatics",
         "DS 215 Systems Biology",
         "DS 213 Computational Biology",
-    ],
-    "Data_Visualization": ["DS 116 Data Visualization"],
-    "Capstone": ["DS 299 Capstone"],
-    "Foundation": [
+    ),
+    "Data_Visualization": ("DS 116 Data Visualization",),
+    "Capstone": ("DS 299 Capstone",),
+    "Foundation": (
         "FND 101 Freshman Seminar 1",
         "FND 102 Freshman Seminar 2",
         "FND 103 Armenian Language & Literature 1",
@@ -148,8 +164,8 @@ COURSE_GROUPS = {
         "FND 110 Physical Education",
         "FND 152 First Aid",
         "FND 153 Civil Defence",
-    ],
-    "CHSS": [
+    ),
+    "CHSS": (
         "CHSS 170 Religion in America",
         "CHSS 184 Social Psychology",
         "CHSS 203 Philosophy of Mind",
@@ -159,13 +175,13 @@ COURSE_GROUPS = {
         "CHSS 272 Comparative Religion",
         "CHSS 283 Trust",
         "CHSS 296 Special Topics in Social Sciences: Critical Thinking for the Digital Era",
-    ],
-    "CSE_Other": [
+    ),
+    "CSE_Other": (
         "CSE 145 Geographic Information Systems",
         "CSE 175 Relativity",
         "CSE 181 Creativity and Technological Innovation",
         "CSE 210 Historical Development of Mathematical Ideas",
-    ],
+    ),
 }
 
 # Map course groups to departments
@@ -188,37 +204,170 @@ COURSE_GROUP_TO_DEPT = {
     "CSE_Other": "Akian College of Science and Engineering",
 }
 
+# Department used when a course or instructor has no better match
+DEFAULT_DEPT = "Akian College of Science and Engineering"
+
+# Inverted index of COURSE_GROUPS: course name -> department of its group
+COURSE_TO_DEPT = {
+    course_name: COURSE_GROUP_TO_DEPT.get(group_name, DEFAULT_DEPT)
+    for group_name, course_list in COURSE_GROUPS.items()
+    for course_name in course_list
+}
+
+# Fallback for courses outside COURSE_GROUPS: course prefix -> department
+PREFIX_TO_DEPT = {
+    "CS": "Akian College of Science and Engineering",
+    "DS": "Akian College of Science and Engineering",
+    "ENGS": "Akian College of Science and Engineering",
+    "CSE": "Akian College of Science and Engineering",
+    "BUS": "Manoogian Simone College of Business and Economics",
+    "CHSS": "College of Humanities and Social Sciences",
+    "FND": "College of Humanities and Social Sciences",
+}
+
 # Building names
-BUILDINGS = ["Main", "PAB"]
+BUILDINGS = ("Main", "PAB")
 
 # Duration options for sections
-DURATION_OPTIONS = ["6 weeks", "8 weeks", "12 weeks"]
+DURATION_OPTIONS = ("6 weeks", "8 weeks", "12 weeks")
 
 # Year options for sections
-YEAR_OPTIONS = [2023, 2024, 2025]
+YEAR_OPTIONS = (2023, 2024, 2025)
 
 # Semester options
-SEMESTER_OPTIONS = ['Fall', 'Spring', 'Summer']
+SEMESTER_OPTIONS = ('Fall', 'Spring', 'Summer')
+
+# MWF schedule (50-minute classes): (start, end) as "HH:MM:SS"
+MWF_DAYS = ("Mon", "Wed", "Fri")
+MWF_TIMES = tuple(
+    (f"{hour:02d}:30:00", f"{hour + 1:02d}:20:00") for hour in range(8, 20)
+)
+
+# T/Th schedule (75-minute classes): (start, end) as "HH:MM:SS"
+TTH_DAYS = ("Tue", "Thu")
+TTH_TIMES = (
+    ("09:00:00", "10:15:00"),
+    ("10:30:00", "11:45:00"),
+    ("12:00:00", "13:15:00"),
+    ("13:30:00", "14:45:00"),
+    ("15:00:00", "16:15:00"),
+    ("16:30:00", "17:45:00"),
+    ("18:00:00", "19:15:00"),
+    ("19:30:00", "20:45:00"),
+)
+
+# Weekly (day, start, end) patterns: every MWF pattern, then every T/Th pattern
+WEEKLY_PATTERNS = tuple(
+    (day, start_time, end_time)
+    for days, times in ((MWF_DAYS, MWF_TIMES), (TTH_DAYS, TTH_TIMES))
+    for day in days
+    for start_time, end_time in times
+)
+
+# Course-name keywords marking low-credit (1-2 credit) courses
+LOW_CREDIT_KEYWORDS = ("Seminar", "Physical Education", "First Aid", "Civil Defence")
+
+
+def course_base_credits(course_name):
+    """
+    Description:
+        Lower bound of a course's credit range: low-credit courses get 1-2, the rest 3-4.
+    
+    Input:
+        course_name (str)
+    
+    Output:
+        int: 1 for low-credit courses, otherwise 3
+    """
+    return 1 if any(keyword in course_name for keyword in LOW_CREDIT_KEYWORDS) else 3
+
+
+# Base credits per catalogue course, resolved once at import
+COURSE_BASE_CREDITS = {course_name: course_base_credits(course_name) for course_name in COURSES}
+
+# Target credits per standing: Freshman, Sophomore, Junior, Senior
+STANDING_CREDITS = (0, 30, 60, 90)
 
-# Courses with cluster numbers - mapping course name to list of possible cluster numbers
+# Letter grades drawn for completed courses
+GRADES = ("A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "F", "P", "NP")
+
+# Courses with cluster numbers - mapping course name to tuple of possible cluster numbers
 COURSES_WITH_CLUSTERS = {
-    "CHSS 170 Religion in America": [1, 2, 3, 4, 6],
-    "CHSS 184 Social Psychology": [3, 4, 6],
-    "CHSS 203 Philosophy of Mind": [3, 6],
-    "CHSS 205 Learning, activism, and social movements": [2, 4, 6],
-    "CHSS 230 Asian Art": [1, 2],
-    "CHSS 240 Music and Literature": [1],
-    "CHSS 272 Comparative Religion": [1, 2, 3, 4, 6],
-    "CHSS 283 Trust": [4, 5, 6],
-    "CHSS 296 Special Topics in Social Sciences: Critical Thinking for the Digital Era": [1, 4, 6],
-    "CSE 110 Introduction to Computer Science": [7, 8, 9],
-    "CSE 145 Geographic Information Systems": [7, 8, 9],
-    "CSE 175 Relativity": [8],
-    "CSE 181 Creativity and Technological Innovation": [5, 9],
-    "CSE 210 Historical Development of Mathematical Ideas": [3, 7, 8, 9],
-    "CSE 222 Technology Marketing": [5, 9],
+    "CHSS 170 Religion in America": (1, 2, 3, 4, 6),
+    "CHSS 184 Social Psychology": (3, 4, 6),
+    "CHSS 203 Philosophy of Mind": (3, 6),
+    "CHSS 205 Learning, activism, and social movements": (2, 4, 6),
+    "CHSS 230 Asian Art": (1, 2),
+    "CHSS 240 Music and Literature": (1,),
+    "CHSS 272 Comparative Religion": (1, 2, 3, 4, 6),
+    "CHSS 283 Trust": (4, 5, 6),
+    "CHSS 296 Special Topics in Social Sciences: Critical Thinking for the Digital Era": (1, 4, 6),
+    "CSE 110 Introduction to Computer Science": (7, 8, 9),
+    "CSE 145 Geographic Information Systems": (7, 8, 9),
+    "CSE 175 Relativity": (8,),
+    "CSE 181 Creativity and Technological Innovation": (5, 9),
+    "CSE 210 Historical Development of Mathematical Ideas": (3, 7, 8, 9),
+    "CSE 222 Technology Marketing": (5, 9),
+}
+
+# Prerequisite edges as (course, prerequisite) pairs
+PREREQ_EDGES = (
+    ("CS 101 Calculus 2", "CS 100 Calculus 1"),  # Calculus chain
+    ("CS 102 Calculus 3", "CS 101 Calculus 2"),
+    ("ENGS 211 Numerical Methods", "CS 104 Linear Algebra"),  # Numerical Methods needs Linear Algebra
+    ("CS 108 Statistics 1", "CS 107 Probability"),  # Statistics 1 needs Probability
+    ("DS 110 Statistics 2", "CS 108 Statistics 1"),  # Statistics 2 needs Statistics 1
+    ("DS 120 Programming for Data Science", "CS 110 Intro to Computer Science"),  # Needs CS110
+)
+
+# Advanced prerequisite edges, each included at random
+OPTIONAL_PREREQ_EDGES = (
+    ("CS 251 Machine Learning", "CS 104 Linear Algebra"),
+    ("CS 246 Artificial Intelligence", "CS 111 Discrete Math"),
+)
+
+# Predefined names/usernames for the first students (names must match usernames)
+PREDEFINED_STUDENT_NAMES = ("Armen", "Alla", "Levon", "Marieta", "Yeva")
+
+# Section letters, assigned to sections round-robin
+SECTION_LETTERS = "ABCDEFGHIJ"
+
+# Cluster themes by cluster number
+CLUSTER_DESCRIPTIONS = {
+    1: "Arts and Humanities",
+    2: "Social Sciences",
+    3: "Philosophy and Ethics",
+    4: "Social Psychology and Behavior",
+    5: "Innovation and Technology",
+    6: "Critical Thinking and Analysis",
+    7: "Computer Science Foundations",
+    8: "Mathematical Sciences",
+    9: "Technology and Society",
 }
 
+# BSDS course IDs that also count toward GENED (cross-listed foundational courses)
+BSDS_GENED_SHARED_COURSES = (
+    1,   # CS 100 Calculus 1
+    2,   # CS 101 Calculus 2
+    3,   # CS 102 Calculus 3
+    6,   # CS 111 Discrete Math
+    8,   # CS 107 Probability
+    9,   # CS 108 Statistics 1
+    10,  # DS 110 Statistics 2
+    11,  # CS 110 Intro to Computer Science
+    16,  # CS 104 Linear Algebra
+)
+
+# (program, course id) rows for hascourse, fixed by the COURSES order:
+# 1-27 BSDS, 28-36 FND, 37+ GENED, plus the cross-listed BSDS courses under GENED.
+# dict.fromkeys drops any repeated pair (keeping order), so rows are unique by primary key
+HASCOURSE_PAIRS = tuple(dict.fromkeys(
+    tuple(("BSDS", course_id) for course_id in range(1, 28))
+    + tuple((FND_PROGRAM, course_id) for course_id in range(28, 37))
+    + tuple((GENED_PROGRAM, course_id) for course_id in range(37, len(COURSES) + 1))
+    + tuple((GENED_PROGRAM, course_id) for course_id in BSDS_GENED_SHARED_COURSES)
+))
+
 
 def generate_student(student_id, program_name=None, target_credits=None, name=None):
     """
@@ -240,15 +389,7 @@ def generate_student(student_id, program_name=None, target_credits=None, name=No
     # If target_credits not specified, assign based on standing distribution
     if target_credits is None:
         # Distribute students across standings: 25% each
-        standing_choice = random.choice(["Freshman", "Sophomore", "Junior", "Senior"])
-        if standing_choice == "Freshman":
-            target_credits = 0
-        elif standing_choice == "Sophomore":
-            target_credits = 30
-        elif standing_choice == "Junior":
-            target_credits = 60
-        else:  # Senior
-            target_credits = 90
+        target_credits = random.choice(STANDING_CREDITS)
     
     # Use provided name or generate random one
     student_name = name if name is not None else fake.name()
@@ -256,24 +397,50 @@ def generate_student(student_id, program_name=None, target_credits=None, name=No
     return {
         "id": student_id,
         "name": student_name,
-        "credit": target_credits,  # Will be updated to match actual completed courses
+        "credit": target_credits,  # Target until generate_takes_data sets the actual completed credits
         "program_name": program_name,
-        "_target_credits": target_credits,  # Store target for later use
     }
 
 
-def generate_location(room_id):
+def generate_students(num_students, program_name=None, names=()):
+    """
+    Description:
+        Generate student records in bulk, drawing every student's standing in a single call.
+    
+    Input:
+        num_students (int): Number of students (IDs 1..num_students)
+        program_name (str, optional): Program name for all students
+        names (sequence[str]): Names for the first len(names) students; the rest get random names
+    
+    Output:
+        List of student dicts as produced by generate_student()
+    """
+    target_credits = random.choices(STANDING_CREDITS, k=num_students)
+    return [
+        generate_student(
+            student_id,
+            program_name,
+            target_credits=credits,
+            name=names[student_id - 1] if student_id <= len(names) else None,
+        )
+        for student_id, credits in enumerate(target_credits, start=1)
+    ]
+
+
+def generate_location(room_id, building=None):
     """
     Description:
         Generate a location record for a room in Main or PAB.
     
     Input:
         room_id (int): Numeric room identifier (e.g., 101)
+        building (str, optional): Building name; drawn from BUILDINGS if None
     
     Output:
         Dict with keys 'room_id' and 'building_room_name'
     """
-    building = random.choice(BUILDINGS)
+    if building is None:
+        building = random.choice(BUILDINGS)
     building_room_name = f"{building} {room_id}"
 
     return {
@@ -283,7 +450,7 @@ def generate_location(room_id):
 
 
 # AUA faculty instructors
-FIXED_INSTRUCTORS = [
+FIXED_INSTRUCTORS = (
     {
         "id": 1,
         "name": "Karen Hovhannisyan",
@@ -304,7 +471,22 @@ FIXED_INSTRUCTORS = [
         "name": "Zaruhi Karabekian",
         "bio_url": "https://people.aua.am/team_member/zaruhi-karabekian-phd/",
     },
-]
+)
+
+# Column-wise view of FIXED_INSTRUCTORS (parallel tuples) for zipping and joins
+INSTRUCTOR_IDS = tuple(prof["id"] for prof in FIXED_INSTRUCTORS)
+INSTRUCTOR_NAMES = tuple(prof["name"] for prof in FIXED_INSTRUCTORS)
+INSTRUCTOR_BIO_URLS = tuple(prof["bio_url"] for prof in FIXED_INSTRUCTORS)
+
+# Courses always taught by a specific instructor; the rest are assigned at random
+FIXED_COURSE_INSTRUCTORS = {
+    "DS 223 Marketing Analytics": 1,
+    "DS 207 Time Series Forecasting": 3,
+    "CS 100 Calculus 1": 2,
+    "CS 101 Calculus 2": 2,
+    "CS 102 Calculus 3": 2,
+    "CHSS 203 Philosophy of Mind": 4,
+}
 
 
 def generate_fixed_instructors(locations):
@@ -319,17 +501,18 @@ def generate_fixed_instructors(locations):
         List of instructor dicts with 'id', 'name', 'bio_url', and 'room_id'
     """
     room_ids = [loc["room_id"] for loc in locations]
-    instructors = []
-    for prof in FIXED_INSTRUCTORS:
-        instructors.append(
-            {
-                "id": prof["id"],
-                "name": prof["name"],
-                "bio_url": prof["bio_url"],
-                "room_id": random.choice(room_ids),
-            }
+    office_room_ids = random.choices(room_ids, k=len(INSTRUCTOR_IDS))
+    return [
+        {
+            "id": instructor_id,
+            "name": name,
+            "bio_url": bio_url,
+            "room_id": room_id,
+        }
+        for instructor_id, name, bio_url, room_id in zip(
+            INSTRUCTOR_IDS, INSTRUCTOR_NAMES, INSTRUCTOR_BIO_URLS, office_room_ids
         )
-    return instructors
+    ]
 
 
 def build_course_to_instructor_map():
@@ -338,28 +521,31 @@ def build_course_to_instructor_map():
         Map each course name to an instructor ID, using fixed assignments and random fallback.
     
     Input:
-        None; uses global COURSES and FIXED_INSTRUCTORS
+        None; uses global COURSES, FIXED_COURSE_INSTRUCTORS and INSTRUCTOR_IDS
     
     Output:
         Dict mapping course_name (str) -> instructor_id (int)
     """
-    course_to_instructor = {}
-    for course_name in COURSES:
-        if course_name == "DS 223 Marketing Analytics":
-            course_to_instructor[course_name] = 1
-        elif course_name == "DS 207 Time Series Forecasting":
-            course_to_instructor[course_name] = 3
-        elif course_name in (
-            "CS 100 Calculus 1",
-            "CS 101 Calculus 2",
-            "CS 102 Calculus 3",
-        ):
-            course_to_instructor[course_name] = 2
-        elif course_name == "CHSS 203 Philosophy of Mind":
-            course_to_instructor[course_name] = 4
-        else:
-            course_to_instructor[course_name] = random.choice([1, 2, 3, 4])
-    return course_to_instructor
+    # One batched draw for every course without a fixed instructor, consumed in COURSES order
+    num_random = sum(course_name not in FIXED_COURSE_INSTRUCTORS for course_name in COURSES)
+    random_ids = iter(random.choices(INSTRUCTOR_IDS, k=num_random))
+
+    return {
+        course_name: FIXED_COURSE_INSTRUCTORS[course_name]
+        if course_name in FIXED_COURSE_INSTRUCTORS
+        else next(random_ids)
+        for course_name in COURSES
+    }
+
+
+# Bio URL patterns for randomly generated instructors ({first}/{last} are lowercased names)
+BIO_URL_PATTERNS = (
+    "https://www.university.edu/faculty/{first}.{last}",
+    "https://www.university.edu/people/{last}-{first}",
+    "https://www.university.edu/instructors/{last}",
+    "https://www.university.edu/department/faculty/{last}",
+    "https://faculty.university.edu/{last}",
+)
 
 
 def generate_instructor(instructor_id):
@@ -377,14 +563,10 @@ def generate_instructor(instructor_id):
     last_name = fake.last_name()
     name = f"{first_name} {last_name}"
 
-    bio_url_patterns = [
-        f"https://www.university.edu/faculty/{first_name.lower()}.{last_name.lower()}",
-        f"https://www.university.edu/people/{last_name.lower()}-{first_name.lower()}",
-        f"https://www.university.edu/instructors/{last_name.lower()}",
-        f"https://www.university.edu/department/faculty/{last_name.lower()}",
-        f"https://faculty.university.edu/{last_name.lower()}",
-    ]
-    bio_url = random.choice(bio_url_patterns)
+    # Only the chosen pattern is formatted
+    bio_url = random.choice(BIO_URL_PATTERNS).format(
+        first=first_name.lower(), last=last_name.lower()
+    )
 
     room_id = random.randint(100, 400)
 
@@ -430,26 +612,22 @@ def generate_program(prog_name, dept_name):
     }
 
 
-def generate_course(course_id, course_name):
+def generate_course(course_id, course_name, credits=None):
     """
     Description:
         Generate a course record with credits.
     
     Input:
-        course_id (int), course_name (str)
+        course_id (int), course_name (str), credits (int, optional; drawn at random if None)
     
     Output:
         Dict with 'id', 'name', and 'credits'
     """
-    if (
-        "Seminar" in course_name
-        or "Physical Education" in course_name
-        or "First Aid" in course_name
-        or "Civil Defence" in course_name
-    ):
-        credits = random.choice([1, 2])
-    else:
-        credits = random.choice([3, 4])
+    if credits is None:
+        base_credits = COURSE_BASE_CREDITS.get(course_name)
+        if base_credits is None:
+            base_credits = course_base_credits(course_name)
+        credits = random.choice((base_credits, base_credits + 1))
 
     return {
         "id": course_id,
@@ -464,7 +642,7 @@ def generate_time_slot(time_slot_id, day_of_week, start_time, end_time, year, se
         Generate a time_slot record with day, formatted start/end times, year, and semester.
     
     Input:
-        time_slot_id (int), day_of_week (str), start_time (datetime.time), end_time (datetime.time), year (int), semester (str)
+        time_slot_id (int), day_of_week (str), start_time (str, "HH:MM:SS"), end_time (str, "HH:MM:SS"), year (int), semester (str)
     
     Output:
         Dict with 'time_slot_id', 'day_of_week', 'start_time', 'end_time', 'year', and 'semester'
@@ -472,27 +650,29 @@ def generate_time_slot(time_slot_id, day_of_week, start_time, end_time, year, se
     return {
         "time_slot_id": time_slot_id,
         "day_of_week": day_of_week,
-        "start_time": start_time.strftime("%H:%M:%S"),
-        "end_time": end_time.strftime("%H:%M:%S"),
+        "start_time": start_time,
+        "end_time": end_time,
         "year": year,
         "semester": semester,
     }
 
 
-def generate_section(section_id, course_id, instructor_id, room_id, time_slot_id):
+def generate_section(section_id, course_id, instructor_id, room_id, time_slot_id, duration=None):
     """
     Description:
         Generate a course section record with fixed capacity and a syllabus URL.
     
     Input:
         section_id, course_id, instructor_id, room_id, time_slot_id (ints)
+        duration (str, optional): Section duration; drawn from DURATION_OPTIONS if None
     
     Output:
         Dict with section metadata including 'capacity', 'duration', and 'syllabus_url'
     Note: year and semester are now stored in the time_slot, not in the section.
     """
     capacity = 30
-    duration = random.choice(DURATION_OPTIONS)
+    if duration is None:
+        duration = random.choice(DURATION_OPTIONS)
     syllabus_url = f"/syllabi/course_{course_id}_section_1.pdf"
 
     return {
@@ -685,96 +865,20 @@ def generate_time_slots():
     Output:
         List of time_slot dicts with IDs, days, start/end times, year, and semester
     """
-    time_slots = []
-    time_slot_id = 1
-
-    # MWF schedule (50-minute classes)
-    mwf_days = ["Mon", "Wed", "Fri"]
-    mwf_start_times = [
-        (8, 30),
-        (9, 30),
-        (10, 30),
-        (11, 30),
-        (12, 30),
-        (13, 30),
-        (14, 30),
-        (15, 30),
-        (16, 30),
-        (17, 30),
-        (18, 30),
-        (19, 30),
-    ]
-    mwf_end_times = [
-        (9, 20),
-        (10, 20),
-        (11, 20),
-        (12, 20),
-        (13, 20),
-        (14, 20),
-        (15, 20),
-        (16, 20),
-        (17, 20),
-        (18, 20),
-        (19, 20),
-        (20, 20),
-    ]
-
-    # T/Th schedule (75-minute classes)
-    tth_days = ["Tue", "Thu"]
-    tth_start_times = [
-        (9, 0),
-        (10, 30),
-        (12, 0),
-        (13, 30),
-        (15, 0),
-        (16, 30),
-        (18, 0),
-        (19, 30),
-    ]
-    tth_end_times = [
-        (10, 15),
-        (11, 45),
-        (13, 15),
-        (14, 45),
-        (16, 15),
-        (17, 45),
-        (19, 15),
-        (20, 45),
+    # One slot per weekly pattern × year × semester, numbered in that order
+    combinations = (
+        (day, start_time, end_time, year, semester)
+        for day, start_time, end_time in WEEKLY_PATTERNS
+        for year in YEAR_OPTIONS
+        for semester in SEMESTER_OPTIONS
+    )
+    return [
+        generate_time_slot(time_slot_id, *combination)
+        for time_slot_id, combination in enumerate(combinations, start=1)
     ]
 
-    # Generate time slots for each combination of:
-    # - Weekly pattern (MWF or T/Th with specific times)
-    # - Year (2023, 2024, 2025)
-    # - Semester (Fall, Spring, Summer)
-    
-    # First, collect all weekly patterns
-    weekly_patterns = []
-    
-    # MWF patterns
-    for day in mwf_days:
-        for i in range(len(mwf_start_times)):
-            start_time = time(mwf_start_times[i][0], mwf_start_times[i][1])
-            end_time = time(mwf_end_times[i][0], mwf_end_times[i][1])
-            weekly_patterns.append((day, start_time, end_time))
-    
-    # T/Th patterns
-    for day in tth_days:
-        for i in range(len(tth_start_times)):
-            start_time = time(tth_start_times[i][0], tth_start_times[i][1])
-            end_time = time(tth_end_times[i][0], tth_end_times[i][1])
-            weekly_patterns.append((day, start_time, end_time))
-    
-    # Generate time slots for each weekly pattern × year × semester combination
-    for day, start_time, end_time in weekly_patterns:
-        for year in YEAR_OPTIONS:
-            for semester in SEMESTER_OPTIONS:
-                time_slots.append(generate_time_slot(time_slot_id, day, start_time, end_time, year, semester))
-                time_slot_id += 1
 
-    return time_slots
-
-
-def generate_takes_data(students, sections, courses, prerequisites):
+def generate_takes_data(students, sections, courses, prerequisites, target_credits=None):
     """
     Description:
         Generate takes records (enrollments) per student while respecting prerequisites.
@@ -785,188 +889,148 @@ def generate_takes_data(students, sections, courses, prerequisites):
         sections (list[dict]): List of section records
         courses (list[dict]): List of course records
         prerequisites (list[dict]): List of prerequisite records
+        target_credits (list[int], optional): Target credits per student, parallel to students;
+            defaults to each student's current 'credit' value (the target set by generate_student)
     
     Output:
         List of takes dicts with status/grade, ensuring prerequisite completion logic
     """
     takes = []
 
-    # Build prerequisite map: course_id -> list of prerequisite course_ids
-    prereq_map = {}
+    if target_credits is None:
+        target_credits = [student.get("credit") or 0 for student in students]
+
+    # Course IDs are small sequential ints, so each student's completed set is kept as an
+    # int bitmask (bit n set = course n completed) and each course's prerequisites as a mask too
+    prereq_masks = defaultdict(int)
     for prereq in prerequisites:
-        course_id = prereq["course_id"]
-        prereq_id = prereq["prerequisite_id"]
-        if course_id not in prereq_map:
-            prereq_map[course_id] = []
-        prereq_map[course_id].append(prereq_id)
-
-    # Build section to course mapping
-    section_to_course = {section["id"]: section["course_id"] for section in sections}
-    
+        prereq_masks[prereq["course_id"]] |= 1 << prereq["prerequisite_id"]
+
     # Build course_id to credits mapping
     course_to_credits = {course["id"]: course["credits"] for course in courses}
 
-    grades = ["A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "F", "P", "NP"]
-
-    for student in students:
+    # Flatten everything the per-student loops need into one tuple per section:
+    # (section_id, course_bit, prereq_mask, credits). Built once, shuffled per student.
+    section_rows = []
+    for section in sections:
+        course_id = section["course_id"]
+        section_rows.append((
+            section["id"],
+            1 << course_id,
+            prereq_masks.get(course_id, 0),
+            course_to_credits.get(course_id, 0),
+        ))
+
+    # Bind RNG methods to locals once; they are called for every student/section below
+    choice = random.choice
+    choices = random.choices
+    randrange = random.randrange
+
+    # Number of in-progress (enrolled) courses per student (1-3), drawn for all students at once
+    enrollment_counts = choices((1, 2, 3), k=len(students))
+
+    for student, student_target, num_enrollments in zip(students, target_credits, enrollment_counts):
         student_id = student["id"]
-        completed_courses = set()
-        target_credits = student.get("_target_credits", 0)  # Get target credits
+        completed_mask = 0
         current_credits = 0
 
-        # Shuffle sections for random selection
-        available_sections = sections.copy()
-        random.shuffle(available_sections)
-
-        # First pass: Generate completed courses until we reach target credits
-        for section in available_sections:
-            section_id = section["id"]
-            course_id = section_to_course[section_id]
-
-            # Check prerequisites
-            can_enroll = True
-            if course_id in prereq_map:
-                required_prereqs = prereq_map[course_id]
-                if not all(prereq_id in completed_courses for prereq_id in required_prereqs):
-                    can_enroll = False
-
-            if not can_enroll:
+        # Draw this student's grades in one call; most courses are worth 3-4 credits,
+        # so student_target // 3 (+ slack) covers the completed pass in practice
+        grade_iter = iter(choices(GRADES, k=student_target // 3 + 5))
+
+        # Visit sections in random order with a lazy Fisher-Yates: each step swaps a random
+        # unvisited row into place, so a student who fills up early stops shuffling too
+        available_sections = section_rows.copy()
+        remaining = len(available_sections)
+        taken_mask = 0  # completed or enrolled courses, so a course is never taken twice
+
+        # Completed pass: complete courses until we reach target credits. Rows skipped for
+        # unmet prerequisites or credit overshoot are deferred (in visit order) to the enrolled pass
+        deferred = []
+        while remaining and current_credits < student_target:
+            pick = randrange(remaining)
+            remaining -= 1
+            row = available_sections[pick]
+            available_sections[pick] = available_sections[remaining]
+            section_id, course_bit, required_mask, course_credits = row
+
+            # Skip courses already taken
+            if taken_mask & course_bit:
                 continue
 
-            # If we haven't reached target credits, prioritize completed courses
-            if current_credits < target_credits:
-                course_credits = course_to_credits.get(course_id, 0)
-                # Only add if it won't exceed target by too much (allow some flexibility)
-                if current_credits + course_credits <= target_credits + 5:
-                    grade = random.choice(grades)
-                    takes.append(generate_takes(student_id, section_id, "completed", grade))
-                    completed_courses.add(course_id)
-                    current_credits += course_credits
-                    continue
-
-        # Second pass: Add some enrolled courses (1-3)
-        num_enrollments = random.randint(1, 3)
-        enrolled_count = 0
-        
-        for section in available_sections:
-            if enrolled_count >= num_enrollments:
-                break
-                
-            section_id = section["id"]
-            course_id = section_to_course[section_id]
-
-            # Skip if already completed
-            if course_id in completed_courses:
+            # Check prerequisites, and only add if it won't exceed target by too much
+            # (allow some flexibility)
+            if (required_mask & completed_mask != required_mask
+                    or current_credits + course_credits > student_target + 5):
+                deferred.append(row)
                 continue
 
-            # Check prerequisites
-            can_enroll = True
-            if course_id in prereq_map:
-                required_prereqs = prereq_map[course_id]
-                if not all(prereq_id in completed_courses for prereq_id in required_prereqs):
-                    can_enroll = False
+            grade = next(grade_iter, None) or choice(GRADES)
+            takes.append(generate_takes(student_id, section_id, "completed", grade))
+            completed_mask |= course_bit
+            taken_mask |= course_bit
+            current_credits += course_credits
 
-            if not can_enroll:
+        # Enrolled pass: add 1-3 enrolled courses, checking prerequisites against the final
+        # completed set. Deferred rows come first and the unvisited rows continue the lazy
+        # shuffle, so candidates are seen in the same random order as one full shuffle
+        enrolled_count = 0
+        deferred_index = 0
+        while enrolled_count < num_enrollments and (deferred_index < len(deferred) or remaining):
+            if deferred_index < len(deferred):
+                row = deferred[deferred_index]
+                deferred_index += 1
+            else:
+                pick = randrange(remaining)
+                remaining -= 1
+                row = available_sections[pick]
+                available_sections[pick] = available_sections[remaining]
+            section_id, course_bit, required_mask, _ = row
+
+            # Skip if already taken and check prerequisites
+            if taken_mask & course_bit or required_mask & completed_mask != required_mask:
                 continue
 
-            # Add as enrolled
             takes.append(generate_takes(student_id, section_id, "enrolled", None))
+            taken_mask |= course_bit
             enrolled_count += 1
-        
+
         # Update student's credit field to match actual completed credits
         student["credit"] = current_credits
 
     return takes
 
 
-def generate_prerequisites_data(courses):
+def generate_prerequisites_data(courses, course_name_to_id=None):
     """
     Description:
         Generate a minimal prerequisite set based on course names and simple rules.
     
     Input:
         courses (list[dict]) – course records with 'id' and 'name'
+        course_name_to_id (dict, optional) – prebuilt name -> id map for courses
     
     Output:
         List of prerequisite dicts produced by generate_prerequisites()
     """
     prerequisites = []
-    course_name_to_id = {course["name"]: course["id"] for course in courses}
-
-    # Calculus chain
-    if "CS 100 Calculus 1" in course_name_to_id and "CS 101 Calculus 2" in course_name_to_id:
-        prerequisites.append(
-            generate_prerequisites(
-                course_name_to_id["CS 101 Calculus 2"],
-                course_name_to_id["CS 100 Calculus 1"],
-            )
-        )
+    if course_name_to_id is None:
+        course_name_to_id = {course["name"]: course["id"] for course in courses}
 
-    if "CS 101 Calculus 2" in course_name_to_id and "CS 102 Calculus 3" in course_name_to_id:
-        prerequisites.append(
-            generate_prerequisites(
-                course_name_to_id["CS 102 Calculus 3"],
-                course_name_to_id["CS 101 Calculus 2"],
-            )
-        )
-
-    # Numerical Methods needs Linear Algebra
-    if "ENGS 211 Numerical Methods" in course_name_to_id and "CS 104 Linear Algebra" in course_name_to_id:
-        prerequisites.append(
-            generate_prerequisites(
-                course_name_to_id["ENGS 211 Numerical Methods"],
-                course_name_to_id["CS 104 Linear Algebra"],
-            )
-        )
-
-    # Statistics 1 needs Probability
-    if "CS 108 Statistics 1" in course_name_to_id and "CS 107 Probability" in course_name_to_id:
-        prerequisites.append(
-            generate_prerequisites(
-                course_name_to_id["CS 108 Statistics 1"],
-                course_name_to_id["CS 107 Probability"],
-            )
-        )
-
-    # Statistics 2 needs Statistics 1
-    if "DS 110 Statistics 2" in course_name_to_id and "CS 108 Statistics 1" in course_name_to_id:
-        prerequisites.append(
-            generate_prerequisites(
-                course_name_to_id["DS 110 Statistics 2"],
-                course_name_to_id["CS 108 Statistics 1"],
-            )
-        )
-
-    # Programming for Data Science needs CS110
-    if (
-        "DS 120 Programming for Data Science" in course_name_to_id
-        and "CS 110 Intro to Computer Science" in course_name_to_id
-    ):
-        prerequisites.append(
-            generate_prerequisites(
-                course_name_to_id["DS 120 Programming for Data Science"],
-                course_name_to_id["CS 110 Intro to Computer Science"],
-            )
-        )
-
-    # Optional advanced prerequisites
-    if "CS 251 Machine Learning" in course_name_to_id and "CS 104 Linear Algebra" in course_name_to_id:
-        if random.choice([True, False]):
+    for course_name, prereq_name in PREREQ_EDGES:
+        if course_name in course_name_to_id and prereq_name in course_name_to_id:
             prerequisites.append(
-                generate_prerequisites(
-                    course_name_to_id["CS 251 Machine Learning"],
-                    course_name_to_id["CS 104 Linear Algebra"],
-                )
+                generate_prerequisites(course_name_to_id[course_name], course_name_to_id[prereq_name])
             )
 
-    if "CS 246 Artificial Intelligence" in course_name_to_id and "CS 111 Discrete Math" in course_name_to_id:
-        if random.choice([True, False]):
-            prerequisites.append(
-                generate_prerequisites(
-                    course_name_to_id["CS 246 Artificial Intelligence"],
-                    course_name_to_id["CS 111 Discrete Math"],
+    # Optional advanced prerequisites (each kept with 50% probability, flips drawn at once)
+    keep_flags = random.choices((True, False), k=len(OPTIONAL_PREREQ_EDGES))
+    for (course_name, prereq_name), keep in zip(OPTIONAL_PREREQ_EDGES, keep_flags):
+        if course_name in course_name_to_id and prereq_name in course_name_to_id:
+            if keep:
+                prerequisites.append(
+                    generate_prerequisites(course_name_to_id[course_name], course_name_to_id[prereq_name])
                 )
-            )
 
     return prerequisites
 
@@ -989,7 +1053,9 @@ def generate_university_dataset(
     """
     # Generate sequential room_ids starting from 1
     room_ids = list(range(1, num_locations + 1))
-    locations = [generate_location(room_id) for room_id in room_ids]
+    # Draw every room's building in one call
+    buildings = random.choices(BUILDINGS, k=num_locations)
+    locations = [generate_location(room_id, building) for room_id, building in zip(room_ids, buildings)]
 
     instructors = generate_fixed_instructors(locations)
 
@@ -997,283 +1063,180 @@ def generate_university_dataset(
 
     num_instructors = len(instructors)
 
-    courses = []
-    for idx, course_name in enumerate(COURSES, start=1):
-        courses.append(generate_course(idx, course_name))
+    # Draw every course's credit value at once: base credits plus a random 0/1 bump
+    credit_bumps = random.choices((0, 1), k=len(COURSES))
+    courses = [
+        generate_course(idx, course_name, COURSE_BASE_CREDITS[course_name] + bump)
+        for idx, (course_name, bump) in enumerate(zip(COURSES, credit_bumps), start=1)
+    ]
+
+    # Resolve course names to IDs once; the per-course lookups below are keyed by ID
+    course_name_to_id = {course["name"]: course["id"] for course in courses}
+    course_id_to_instructor = {
+        course_name_to_id[course_name]: instructor_id
+        for course_name, instructor_id in course_to_instructor.items()
+        if course_name in course_name_to_id
+    }
 
     time_slots = generate_time_slots()
 
-    departments = []
-    dept_locations = {}
-    for i, dept_name in enumerate(DEPARTMENTS):
-        room_id = locations[i % len(locations)]["room_id"]
-        dept_locations[dept_name] = room_id
-        departments.append(generate_department(dept_name, room_id))
-
-    programs = []
-    program_to_dept = {
-        "BAB": "Manoogian Simone College of Business and Economics",
-        "BAEC": "College of Humanities and Social Sciences",
-        "BAPG": "College of Humanities and Social Sciences",
-        "BSCS": "Akian College of Science and Engineering",
-        "BSDS": "Akian College of Science and Engineering",
-        "BSES": "Akian College of Science and Engineering",
-        "BSN": "Turpanjian College of Health Sciences",
-        "BSESS": "Akian College of Science and Engineering",
-        "BSE": "Manoogian Simone College of Business and Economics",
-        "FND": "College of Humanities and Social Sciences",    # Foundation program
-        "GENED": "College of Humanities and Social Sciences",  # General Education program
-    }
+    # Round-robin departments over the locations
+    departments = [
+        generate_department(dept_name, location["room_id"])
+        for dept_name, location in zip(DEPARTMENTS, cycle(locations))
+    ]
 
-    # All students are assigned to BSDS program
-    student_program_map = {}
-    bsds_dept_name = program_to_dept["BSDS"]
-    fnd_dept_name = program_to_dept["FND"]
-    gened_dept_name = program_to_dept["GENED"]
-    
-    # Create program entries for BSDS, FND, and GENED
-    programs.append(generate_program("BSDS", bsds_dept_name))
-    programs.append(generate_program("FND", fnd_dept_name))
-    programs.append(generate_program("GENED", gened_dept_name))
-    
-    # Assign all students to BSDS
-    for student_id in range(1, num_students + 1):
-        student_program_map[student_id] = "BSDS"
-    
-    # Predefined names for first 5 students (must match usernames)
-    predefined_names = ["Armen", "Alla", "Levon", "Marieta", "Yeva"]
+    # Create program entries for BSDS, FND, and GENED (all students are in BSDS); one row per program
+    programs = [
+        generate_program("BSDS", PROGRAM_TO_DEPT["BSDS"]),
+        generate_program(FND_PROGRAM, PROGRAM_TO_DEPT[FND_PROGRAM]),
+        generate_program(GENED_PROGRAM, PROGRAM_TO_DEPT[GENED_PROGRAM]),
+    ]
+
+    # Derive usernames first so each student is named once, from its username
+    usernames_list = []
+    usernames_seen = set()  # membership checks; usernames_list keeps student order
+    for i in range(num_students):
+        if i < len(PREDEFINED_STUDENT_NAMES):
+            # First 5: use predefined username
+            username = PREDEFINED_STUDENT_NAMES[i]
+        else:
+            # Remaining 5: generate username from random name (first initial + last name)
+            random_name = fake.name()
+            name_parts = random_name.split()
+            if len(name_parts) >= 2:
+                first_initial = name_parts[0][0].lower()
+                last_name = name_parts[-1].lower()
+                username = f"{first_initial}{last_name}"
+            else:
+                username = f"student{i + 1}"
+        
+        # Ensure username is unique and within 50 char limit
+        base_username = username[:50]
+        final_username = base_username
+        counter = 1
+        while final_username in usernames_seen:
+            suffix = str(counter)
+            max_base_len = 50 - len(suffix)
+            final_username = f"{base_username[:max_base_len]}{suffix}"
+            counter += 1
+        
+        usernames_list.append(final_username)
+        usernames_seen.add(final_username)
     
     # Generate students with their program names (all BSDS)
-    # First 5 use predefined names, rest get random names
-    students = []
-    for i in range(1, num_students + 1):
-        if i <= len(predefined_names):
-            # Use predefined name for first 5 students
-            student_name = predefined_names[i - 1]
-        else:
-            # Generate random name for remaining students
-            student_name = None  # Will be generated by generate_student
-        students.append(generate_student(i, "BSDS", name=student_name))
-
-    sections = []
-    section_id = 1
-    for course in courses:
-        instructor_id = course_to_instructor.get(course["name"], 1)
-        room_id = random.choice([loc["room_id"] for loc in locations])
-        # Select a random time slot (which already includes year and semester)
-        time_slot = random.choice(time_slots)
-        section = generate_section(
+    # Student name is the username with its first letter capitalized
+    students = generate_students(
+        num_students,
+        "BSDS",
+        names=[username.capitalize() for username in usernames_list],
+    )
+
+    # Draw every section's room, time slot (which already includes year and semester)
+    # and duration up front; locations were built from room_ids, so rooms come from there
+    section_rooms = random.choices(room_ids, k=len(courses))
+    section_time_slots = random.choices(time_slots, k=len(courses))
+    section_durations = random.choices(DURATION_OPTIONS, k=len(courses))
+    sections = [
+        generate_section(
             section_id,
             course["id"],
-            instructor_id,
+            course_id_to_instructor.get(course["id"], 1),
             room_id,
             time_slot["time_slot_id"],
+            duration,
         )
-        sections.append(section)
-        section_id += 1
-
-    prerequisites = generate_prerequisites_data(courses)
+        for section_id, (course, room_id, time_slot, duration) in enumerate(
+            zip(courses, section_rooms, section_time_slots, section_durations), start=1
+        )
+    ]
 
-    takes = generate_takes_data(students, sections, courses, prerequisites)
-    
-    # Clean up temporary _target_credits field from students
-    for student in students:
-        if "_target_credits" in student:
-            del student["_target_credits"]
+    prerequisites = generate_prerequisites_data(courses, course_name_to_id)
 
-    works = []
+    # Each student's "credit" still holds its target here; takes generation overwrites it
+    target_credits = [student["credit"] for student in students]
+    takes = generate_takes_data(students, sections, courses, prerequisites, target_credits)
 
-    instructor_to_dept = {}
-    instructor_dept_counts = {}
+    instructor_dept_counts = defaultdict(Counter)
 
     for course_name, instructor_id in course_to_instructor.items():
-        dept_name = None
-        for group_name, course_list in COURSE_GROUPS.items():
-            if course_name in course_list:
-                dept_name = COURSE_GROUP_TO_DEPT.get(group_name, "Akian College of Science and Engineering")
-                break
-
-        if not dept_name:
-            prefix = course_name.split()[0] if course_name.split() else ""
-            if prefix in ["CS", "DS", "ENGS", "CSE"]:
-                dept_name = "Akian College of Science and Engineering"
-            elif prefix == "BUS":
-                dept_name = "Manoogian Simone College of Business and Economics"
-            elif prefix in ["CHSS", "FND"]:
-                dept_name = "College of Humanities and Social Sciences"
-            else:
-                dept_name = "Akian College of Science and Engineering"
-
-        if instructor_id not in instructor_dept_counts:
-            instructor_dept_counts[instructor_id] = {}
-        instructor_dept_counts[instructor_id][dept_name] = (
-            instructor_dept_counts[instructor_id].get(dept_name, 0) + 1
+        dept_name = COURSE_TO_DEPT.get(course_name) or PREFIX_TO_DEPT.get(
+            course_name.partition(" ")[0], DEFAULT_DEPT
         )
+        instructor_dept_counts[instructor_id][dept_name] += 1
 
-    for instructor_id, dept_counts in instructor_dept_counts.items():
-        most_common_dept = max(dept_counts.items(), key=lambda x: x[1])[0]
-        instructor_to_dept[instructor_id] = most_common_dept
-
+    # Each instructor works in the department they teach most courses for
+    works = []
     for instructor_id in range(1, num_instructors + 1):
-        dept_name = instructor_to_dept.get(instructor_id, "Akian College of Science and Engineering")
+        dept_counts = instructor_dept_counts.get(instructor_id)
+        dept_name = dept_counts.most_common(1)[0][0] if dept_counts else DEFAULT_DEPT
         works.append(generate_works(dept_name, instructor_id))
 
-    hascourse = []
-    # For BSDS program: assign first 27 courses (BSDS courses)
-    bsds_course_ids = list(range(1, 28))  # Courses 1-27 are BSDS courses
-    for course_id in bsds_course_ids:
-        hascourse.append(generate_hascourse("BSDS", course_id))
-    
-    # For FND program: assign FND courses (28-36) - Foundation courses
-    fnd_course_ids = list(range(28, 37))  # Courses 28-36 are FND courses
-    for course_id in fnd_course_ids:
-        hascourse.append(generate_hascourse("FND", course_id))
-    
-    # For GENED program: assign remaining courses (37-51) - General Education (CHSS, CSE)
-    gened_course_ids = list(range(37, len(courses) + 1))  # Courses 37-51
-    for course_id in gened_course_ids:
-        hascourse.append(generate_hascourse("GENED", course_id))
-    
-    # Some courses belong to both BSDS and GENED (cross-listed courses)
-    # These are typically foundational courses that count toward both major and general education
-    # Examples: Calculus, Statistics, Linear Algebra, Intro CS, Discrete Math
-    bsds_gened_shared_courses = [
-        1,   # CS 100 Calculus 1
-        2,   # CS 101 Calculus 2
-        3,   # CS 102 Calculus 3
-        6,   # CS 111 Discrete Math
-        8,   # CS 107 Probability
-        9,   # CS 108 Statistics 1
-        10,  # DS 110 Statistics 2
-        11,  # CS 110 Intro to Computer Science
-        16,  # CS 104 Linear Algebra
-    ]
-    
-    # Add these courses to GENED as well (they're already in BSDS)
-    for course_id in bsds_gened_shared_courses:
-        hascourse.append(generate_hascourse("GENED", course_id))
+    # Program/course links are fixed by the course catalogue (see HASCOURSE_PAIRS)
+    hascourse = [generate_hascourse(prog_name, course_id) for prog_name, course_id in HASCOURSE_PAIRS]
 
     clusters = []
     cluster_id = 1
-    cluster_descriptions = {
-        1: "Arts and Humanities",
-        2: "Social Sciences",
-        3: "Philosophy and Ethics",
-        4: "Social Psychology and Behavior",
-        5: "Innovation and Technology",
-        6: "Critical Thinking and Analysis",
-        7: "Computer Science Foundations",
-        8: "Mathematical Sciences",
-        9: "Technology and Society",
-    }
 
     # Generate clusters for FND and GENED (general education programs)
-    for prog_name in ["FND", "GENED"]:
+    for prog_name in (FND_PROGRAM, GENED_PROGRAM):
         for cluster_num in range(1, 7):
             clusters.append(
                 generate_cluster(
                     cluster_id,
                     cluster_num,
-                    theme=cluster_descriptions.get(cluster_num),
+                    theme=CLUSTER_DESCRIPTIONS.get(cluster_num),
                 )
             )
             cluster_id += 1
 
     # Generate clusters for BSDS (data science program - similar to CS)
-    for cluster_num in [5, 7, 8, 9]:
+    for cluster_num in (5, 7, 8, 9):
         clusters.append(
             generate_cluster(
                 cluster_id,
                 cluster_num,
-                theme=cluster_descriptions.get(cluster_num),
+                theme=CLUSTER_DESCRIPTIONS.get(cluster_num),
             )
         )
         cluster_id += 1
 
-    cluster_lookup = {}
-    for cluster in clusters:
-        key = cluster["cluster_number"]
-        cluster_lookup[key] = cluster["cluster_id"]
-
-    course_clusters = []
-    course_name_to_id = {course["name"]: course["id"] for course in courses}
-
-    for course in courses:
-        course_id = course["id"]
-        course_name = course["name"]
-        
-        # Use COURSES_WITH_CLUSTERS mapping directly instead of reading from course
-        if course_name in COURSES_WITH_CLUSTERS:
-            cluster_numbers = COURSES_WITH_CLUSTERS[course_name]
+    # cluster_number -> cluster_id (the last cluster generated for a number wins)
+    cluster_lookup = {cluster["cluster_number"]: cluster["cluster_id"] for cluster in clusters}
 
-            for cluster_num in cluster_numbers:
-                cluster_id_found = cluster_lookup.get(cluster_num)
-                if cluster_id_found:
-                    course_clusters.append(generate_course_cluster(course_id, cluster_id_found))
+    # Driven directly by COURSES_WITH_CLUSTERS, so courses without clusters are never visited
+    course_clusters = [
+        generate_course_cluster(course_name_to_id[course_name], cluster_lookup[cluster_num])
+        for course_name, cluster_numbers in COURSES_WITH_CLUSTERS.items()
+        if course_name in course_name_to_id
+        for cluster_num in cluster_numbers
+        if cluster_num in cluster_lookup
+    ]
 
-    preferred = []
-    for student in students:
-        student_id = student["id"]
-        num_preferences = random.randint(1, 3)
-        available_courses = courses.copy()
-        random.shuffle(available_courses)
-
-        for course in available_courses[:num_preferences]:
-            preferred.append(
-                generate_preferred(
-                    student_id,
-                    course["id"],
-                )
-            )
+    # 1-3 preferred courses per student: draw all counts at once, then sample only
+    # that many course IDs per student instead of copying and shuffling the catalog
+    course_ids = [course["id"] for course in courses]
+    preference_counts = random.choices((1, 2, 3), k=len(students))
+    sample = random.sample
+    preferred = [
+        generate_preferred(student["id"], course_id)
+        for student, num_preferences in zip(students, preference_counts)
+        for course_id in sample(course_ids, min(num_preferences, len(course_ids)))
+    ]
 
     # Generate users - create 10 users (5 predefined + 5 random) linked to all students
     users = []
-    predefined_usernames = ["Armen", "Alla", "Levon", "Marieta", "Yeva"]
     
-    # Generate usernames for all students first, then update student names to match
-    usernames_list = []
-    for i, student in enumerate(students):
-        if i < len(predefined_usernames):
-            # First 5: use predefined username
-            username = predefined_usernames[i]
-        else:
-            # Remaining 5: generate username from random name (first initial + last name)
-            random_name = fake.name()
-            name_parts = random_name.split()
-            if len(name_parts) >= 2:
-                first_initial = name_parts[0][0].lower()
-                last_name = name_parts[-1].lower()
-                username = f"{first_initial}{last_name}"
-            else:
-                username = f"student{i + 1}"
-        
-        # Ensure username is unique and within 50 char limit
-        base_username = username[:50]
-        final_username = base_username
-        counter = 1
-        while final_username in usernames_list:
-            suffix = str(counter)
-            max_base_len = 50 - len(suffix)
-            final_username = f"{base_username[:max_base_len]}{suffix}"
-            counter += 1
-        
-        usernames_list.append(final_username)
-    
-    # Now update student names to match usernames and create users
+    # Create users linked to the students via their usernames
     for i, (student, username) in enumerate(zip(students, usernames_list)):
-        student_id = student["id"]
-        # Update student name to match username (capitalize first letter)
-        student["name"] = username.capitalize()
-        users.append(generate_user(i + 1, student_id, username=username))
+        users.append(generate_user(i + 1, student["id"], username=username))
 
     # Generate section names - assign section letters (A, B, C, etc.) to sections
-    section_names = []
-    section_letters = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']
-    for i, section in enumerate(sections):
-        section_id = section["id"]
-        # Assign section letter based on index (cycle through A-J)
-        section_letter = section_letters[i % len(section_letters)]
-        section_names.append(generate_section_name(section_letter, section_id))
+    # Assign section letter based on index (cycle through A-J)
+    section_names = [
+        generate_section_name(section_letter, section["id"])
+        for section, section_letter in zip(sections, cycle(SECTION_LETTERS))
+    ]
 
     return {
         "student": students,
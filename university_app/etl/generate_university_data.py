@@ -9,10 +9,9 @@ Usage:
 
 Prerequisites:
     - Database.university_data_generator module must be available
-    - pandas must be installed
 """
 
-import pandas as pd
+import csv
 from loguru import logger
 import os
 from Database.university_data_generator import generate_university_dataset
@@ -70,12 +69,16 @@ def main():
     output_dir = "data"
     os.makedirs(output_dir, exist_ok=True)
 
-    # Save each table to CSV
+    # Save each table to CSV; rows of a table share the same keys, so the first row gives the header
     for table_name in TABLE_NAMES:
-        df = pd.DataFrame(dataset[table_name])
+        rows = dataset[table_name]
         csv_path = f"{output_dir}/{table_name}.csv"
-        df.to_csv(csv_path, index=False)
-        logger.info(f"Saved {len(df)} {table_name} records to {csv_path}")
+        with open(csv_path, "w", newline="", encoding="utf-8") as csv_file:
+            if rows:
+                writer = csv.DictWriter(csv_file, fieldnames=list(rows[0]), lineterminator="\n")
+                writer.writeheader()
+                writer.writerows(rows)
+        logger.info(f"Saved {len(rows)} {table_name} records to {csv_path}")
 
     # Print summary statistics
     print("\n" + "=" * 60)
@@ -13,11 +13,12 @@ Prerequisites:
     - Database must be running and accessible
 """
 
+import io
 import pandas as pd
 from loguru import logger
 import os
 import sys
-from sqlalchemy import text, inspect
+from sqlalchemy import text, inspect, Integer, String, Float, Boolean
 from Database.database import engine, get_db
 from Database.models import (
     User, Student, Location, Instructor, Department, Program, Course,
@@ -88,105 +89,230 @@ LOAD_ORDER = [
     "preferred",      # Depends on student, course
 ]
 
+# Rows per executemany batch when bulk inserting
+BULK_INSERT_BATCH_SIZE = 10_000
 
-def load_csv_to_db(csv_path: str, model_class, db_session):
+# Core INSERT statement per model, built once and reused for every chunk and batch
+INSERT_STATEMENTS = {
+    model_class: model_class.__table__.insert() for model_class in TABLE_MODELS.values()
+}
+
+# Column names defined by each model's table; CSV columns outside this set are dropped before loading
+TABLE_COLUMNS = {
+    model_class: frozenset(column.name for column in model_class.__table__.columns)
+    for model_class in TABLE_MODELS.values()
+}
+
+# Primary key columns per model; chunks are sorted on these so index pages fill in key order
+PRIMARY_KEYS = {
+    model_class: [column.name for column in model_class.__table__.primary_key.columns]
+    for model_class in TABLE_MODELS.values()
+}
+
+# Rows read from a CSV and inserted per chunk when loading a table
+LOAD_CHUNK_SIZE = 10_000
+
+# pandas dtype for each SQLAlchemy column type, so read_csv can skip type inference
+# (nullable extension dtypes keep empty cells as NA instead of turning ints into floats)
+PANDAS_DTYPES = {
+    Integer: "Int64",
+    String: "string",
+    Float: "float64",
+    Boolean: "boolean",
+}
+
+# Column name mapping: CSV file name -> CSV column -> Model field
+COLUMN_MAPPING = {
+    "student": {"id": "student_id", "name": "student_name"},
+}
+
+# Composite key columns to deduplicate on before loading, per CSV file name
+DEDUP_SUBSETS = {
+    "section_name": ["section_name", "section_id"],
+}
+
+
+def csv_dtypes(table_name, model_class):
     """
     Description:
-        Load a single CSV file into the corresponding database table using the given model.
+        Build read_csv dtypes for a CSV file from its model's column types.
+    Renamed columns are keyed by their CSV name; columns of other types are left to inference.
+    
+    Input:
+        table_name (str): CSV file name without extension (key of TABLE_MODELS)
+        model_class: SQLAlchemy model class the CSV is loaded into
+    
+    Output:
+        dict: CSV column -> pandas dtype
+    """
+    csv_columns = {field: column for column, field in COLUMN_MAPPING.get(table_name, {}).items()}
+    return {
+        csv_columns.get(column.name, column.name): PANDAS_DTYPES[type(column.type)]
+        for column in model_class.__table__.columns
+        if type(column.type) in PANDAS_DTYPES
+    }
+
+
+# read_csv dtypes per CSV file name, built once from the models
+TABLE_DTYPES = {
+    table_name: csv_dtypes(table_name, model_class)
+    for table_name, model_class in TABLE_MODELS.items()
+}
+
+
+def bulk_insert(db_session, model_class, rows, batch_size=BULK_INSERT_BATCH_SIZE):
+    """
+    Description:
+        Insert row dicts into a model's table with SQLAlchemy Core executemany, in batches.
+    Runs inside the session's current transaction; the caller commits or rolls back.
     
     Input:
-        csv_path (str): Path to the CSV file (assumed to exist - check in caller)
-        model_class: SQLAlchemy model class
         db_session: SQLAlchemy Session
+        model_class: SQLAlchemy model class whose table receives the rows (one of TABLE_MODELS)
+        rows (list[dict]): Records keyed by column name
+        batch_size (int): Maximum number of rows sent per execute call
     
     Output:
-        int: Number of records inserted into the table
+        int: Number of rows inserted
     """
-    df = pd.read_csv(csv_path)
-    if df.empty:
-        error_msg = f"CSV file is empty: {csv_path}"
-        logger.error(error_msg)
-        raise ValueError(error_msg)
+    stmt = INSERT_STATEMENTS[model_class]
+    for start in range(0, len(rows), batch_size):
+        db_session.execute(stmt, rows[start:start + batch_size])
+    return len(rows)
 
-    # Column name mapping: CSV file name -> CSV column -> Model field
-    csv_filename = os.path.basename(csv_path).replace(".csv", "")
 
-    column_mapping = {
-        "student": {"id": "student_id", "name": "student_name"},
-    }
+def copy_dataframe(db_session, model_class, df):
+    """
+    Description:
+        Stream a DataFrame into a model's table with PostgreSQL COPY FROM STDIN (CSV format).
+    Runs on the session's connection inside its current transaction; the caller commits or rolls back.
+    
+    Input:
+        db_session: SQLAlchemy Session bound to a PostgreSQL (psycopg2) engine
+        model_class: SQLAlchemy model class whose table receives the rows
+        df (pd.DataFrame): Rows whose column names match the table's columns; NaN is loaded as NULL
+    
+    Output:
+        int: Number of rows copied
+    """
+    preparer = db_session.bind.dialect.identifier_preparer
+    table = preparer.format_table(model_class.__table__)
+    columns = ", ".join(preparer.quote(column) for column in df.columns)
 
-    mapping = column_mapping.get(csv_filename, {})
-
-    # Rename columns if mapping exists
-    if mapping:
-        df = df.rename(columns=mapping)
-
-    # Special handling for programs - deduplicate by prog_name (primary key)
-    if csv_filename == "program":
-        df = df.drop_duplicates(subset=["prog_name"], keep="first")
-        logger.info(f"Deduplicated programs: {len(df)} unique programs")
-
-    # Special handling for hascourse - deduplicate by (prog_name, courseid) composite key
-    if csv_filename == "hascourse":
-        original_count = len(df)
-        df = df.drop_duplicates(subset=["prog_name", "courseid"], keep="first")
-        if len(df) < original_count:
-            logger.info(
-                f"Deduplicated hascourse: {len(df)} unique records "
-                f"(removed {original_count - len(df)} duplicates)"
-            )
+    # NaN is written as an unquoted empty field, which COPY's CSV format reads as NULL
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
 
-    # Special handling for section_name - deduplicate by (section_name, section_id) composite key
-    if csv_filename == "section_name":
-        original_count = len(df)
-        df = df.drop_duplicates(subset=["section_name", "section_id"], keep="first")
-        if len(df) < original_count:
-            logger.info(
-                f"Deduplicated section_name: {len(df)} unique records "
-                f"(removed {original_count - len(df)} duplicates)"
-            )
+    cursor = db_session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+    return len(df)
 
-    # Convert DataFrame rows to model instances
-    records = []
-    for _, row in df.iterrows():
-        record_dict = row.to_dict()
-        record_dict = {k: (None if pd.isna(v) else v) for k, v in record_dict.items()}
 
-        try:
-            record = model_class(**record_dict)
-            records.append(record)
-        except Exception as e:
-            logger.error(f"Error creating {model_class.__name__} from row: {record_dict}")
-            logger.error(f"Error: {e}")
-            raise
+def drop_duplicate_keys(df, subset, seen_keys):
+    """
+    Description:
+        Drop rows whose key repeats an earlier row, either in this chunk or in a chunk
+    already loaded from the same CSV. seen_keys is updated in place with the keys kept.
+    
+    Input:
+        df (pd.DataFrame): Chunk to deduplicate
+        subset (list[str]): Key columns identifying a duplicate row
+        seen_keys (set[tuple]): Keys loaded from earlier chunks of the same CSV
+    
+    Output:
+        pd.DataFrame: Chunk without duplicate keys (same columns, possibly zero rows)
+    """
+    df = df.drop_duplicates(subset=subset, keep="first")
+    # Boolean mask, so an empty chunk keeps its columns (a plain list would select columns)
+    keys = pd.MultiIndex.from_frame(df[subset])
+    df = df[~keys.isin(seen_keys)]
+    seen_keys.update(keys)
+    return df
+
 
-    # Insert records (using add_all instead of bulk_save_objects to properly handle
-    # foreign keys and composite primary keys)
-    # For tables with composite primary keys or foreign keys, we need to flush explicitly
+def load_csv_to_db(csv_path: str, model_class, db_session, chunksize=LOAD_CHUNK_SIZE):
+    """
+    Description:
+        Load a single CSV file into the corresponding database table using the given model.
+    The CSV is read and inserted chunk by chunk, so memory stays bounded for large files.
+    The table loads inside a savepoint of the caller's transaction: on failure only this
+    table is rolled back, and committing the load is left to the caller.
+    
+    Input:
+        csv_path (str): Path to the CSV file (assumed to exist - check in caller)
+        model_class: SQLAlchemy model class (one of TABLE_MODELS)
+        db_session: SQLAlchemy Session
+        chunksize (int): Number of CSV rows read and inserted at a time
+    
+    Output:
+        int: Number of records inserted into the table
+    """
+    csv_filename = os.path.basename(csv_path).replace(".csv", "")
+    mapping = COLUMN_MAPPING.get(csv_filename)
+    dedup_subset = DEDUP_SUBSETS.get(csv_filename)
+    dtypes = TABLE_DTYPES.get(csv_filename)
+    primary_key = PRIMARY_KEYS[model_class]
+    table_columns = TABLE_COLUMNS[model_class]
+
+    # PostgreSQL loads each cleaned chunk with COPY; other dialects (e.g. SQLite) fall back
+    # to batched Core executemany over plain dicts
+    use_copy = db_session.bind.dialect.name == "postgresql"
+    num_records = 0
+    df = None  # Chunk currently being loaded (used for error samples)
+    seen_keys = set()  # Dedup keys already loaded from earlier chunks
+
+    savepoint = db_session.begin_nested()
     try:
-        if len(records) == 0:
+        for df in pd.read_csv(csv_path, chunksize=chunksize, dtype=dtypes):
+            # Rename columns if mapping exists
+            if mapping:
+                df = df.rename(columns=mapping)
+
+            # Drop CSV columns the table doesn't define, so every record maps onto the table
+            unknown_columns = [column for column in df.columns if column not in table_columns]
+            if unknown_columns:
+                if num_records == 0:
+                    logger.warning(
+                        f"Ignoring CSV columns not in {model_class.__tablename__}: {unknown_columns}"
+                    )
+                df = df.drop(columns=unknown_columns)
+
+            # Deduplicate by composite key where configured (e.g. section_name, section_id)
+            if dedup_subset:
+                original_count = len(df)
+                df = drop_duplicate_keys(df, dedup_subset, seen_keys)
+                if len(df) < original_count:
+                    logger.info(
+                        f"Deduplicated {csv_filename}: {len(df)} unique records "
+                        f"(removed {original_count - len(df)} duplicates)"
+                    )
+
+            # Insert in primary key order (sequential B-tree writes instead of random page splits)
+            if primary_key and all(column in df.columns for column in primary_key):
+                df = df.sort_values(primary_key, kind="stable")
+
+            # Executes immediately, so foreign key/unique violations raise here
+            if use_copy:
+                copy_dataframe(db_session, model_class, df)
+            else:
+                # NaN -> None for the whole chunk at once (object dtype also yields native Python values)
+                records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+                bulk_insert(db_session, model_class, records)
+            num_records += len(df)
+
+        savepoint.commit()
+        if num_records == 0:
             logger.warning(f"No records to insert for {model_class.__tablename__}")
             return 0
-        
-        # Add records to session
-        db_session.add_all(records)
-        
-        # Flush to send INSERT statements to database (important for foreign key validation)
-        # This will raise an error if there are foreign key constraint violations
-        db_session.flush()
-        
-        # Commit the transaction
-        db_session.commit()
-        
-        # Verify the records were actually inserted
-        inserted_count = db_session.query(model_class).count()
-        logger.info(
-            f"Loaded {len(records)} records from {csv_path} into {model_class.__tablename__} "
-            f"(verified: {inserted_count} total records in table)"
-        )
-        return len(records)
+
+        logger.info(f"Loaded {num_records} records from {csv_path} into {model_class.__tablename__}")
+        return num_records
     except Exception as e:
-        db_session.rollback()
+        savepoint.rollback()
         error_msg = str(e).lower()
         if "duplicate key" in error_msg or "unique constraint" in error_msg:
             logger.error(
@@ -200,15 +326,14 @@ def load_csv_to_db(csv_path: str, model_class, db_session):
                 f"Foreign key constraint violation in {model_class.__tablename__}. "
                 f"This may indicate missing parent records. Error: {e}"
             )
-            if records:
-                sample = records[0]
-                logger.error(f"Sample record that failed: {sample.__dict__ if hasattr(sample, '__dict__') else 'N/A'}")
+            if df is not None and len(df):
+                logger.error(f"Sample record that failed: {df.iloc[0].to_dict()}")
             raise
         logger.error(f"Error loading {csv_path} into database: {e}")
         logger.error(f"Model: {model_class.__name__}, Table: {model_class.__tablename__}")
-        logger.error(f"Number of records attempted: {len(records)}")
-        if records:
-            logger.error(f"First record sample: {records[0].__dict__ if hasattr(records[0], '__dict__') else 'N/A'}")
+        logger.error(f"Records inserted before the failing chunk: {num_records}")
+        if df is not None and len(df):
+            logger.error(f"First record sample: {df.iloc[0].to_dict()}")
         raise
 
 
@@ -260,16 +385,20 @@ def main():
         except:
             pass
         
+        # Reflect the existing table names once instead of once per table
+        try:
+            existing_tables = set(inspect(db.bind).get_table_names())
+        except Exception as e:
+            logger.warning(f"Could not list existing tables: {e}. Attempting to clear all ETL tables...")
+            existing_tables = None
+        
         for table_name in reversed(LOAD_ORDER):
             model_class = TABLE_MODELS[table_name]
             table_name_db = model_class.__tablename__
             
             try:
                 # Check if table exists
-                inspector = inspect(db.bind)
-                table_names = inspector.get_table_names()
-                
-                if table_name_db not in table_names:
+                if existing_tables is not None and table_name_db not in existing_tables:
                     logger.debug(f"Table {table_name_db} does not exist yet, skipping clear")
                     continue
                 
@@ -362,13 +491,24 @@ def main():
                 logger.error(f"   Traceback: {traceback.format_exc()}")
                 logger.error(f"   Continuing to next table...")
                 failed_tables.append(table_name)
-                # Rollback failed transaction and continue
-                try:
-                    db.rollback()
-                except:
-                    pass
+                # load_csv_to_db rolled back its own savepoint; tables loaded so far stay pending
                 continue  # Don't raise, continue to next table
 
+        # All tables are loaded in one transaction, committed once here
+        try:
+            db.commit()
+        except Exception as e:
+            logger.error(f"❌ FAILED to commit loaded tables: {e}")
+            logger.error(f"   Error type: {type(e).__name__}")
+            import traceback
+            logger.error(f"   Traceback: {traceback.format_exc()}")
+            logger.error(f"   Rolled back all {len(successful_tables)} loaded tables")
+            db.rollback()
+            # Nothing was committed, so every table that loaded counts as failed too
+            failed_tables = [t for t in LOAD_ORDER if t in failed_tables or t in successful_tables]
+            successful_tables = []
+            total_records = 0
+
         logger.info(f"\n{'=' * 60}")
         logger.info(f"Data Loading Summary:")
         logger.info(f"{'=' * 60}")
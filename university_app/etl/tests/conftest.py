@@ -0,0 +1,34 @@
+"""
+Test configuration for the ETL scripts.
+Points DATABASE_URL at a throwaway SQLite file and puts the ETL directory on the import path,
+so the scripts' `Database.*` imports resolve the same way they do under run_etl.sh.
+"""
+
+import os
+import sys
+import tempfile
+
+from sqlalchemy import event
+
+ETL_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must be set before Database.database is imported (it builds the engine at import time)
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "etl_test.sqlite")
+
+if ETL_DIR not in sys.path:
+    sys.path.insert(0, ETL_DIR)
+
+from Database.database import engine  # noqa: E402
+
+
+# pysqlite's own transaction handling turns the outermost SAVEPOINT into the transaction
+# itself, so releasing it commits. Let SQLAlchemy emit BEGIN instead, so savepoints nest
+# inside one transaction the way they do on PostgreSQL.
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
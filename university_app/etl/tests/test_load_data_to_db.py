@@ -0,0 +1,224 @@
+"""
+Tests for loading generated CSV files into the database (load_data_to_db.py).
+"""
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from loguru import logger
+from sqlalchemy.dialects import postgresql
+
+from Database.database import SessionLocal
+from Database.models import Cluster, Department, Instructor, Location, SectionName, create_tables
+from load_data_to_db import copy_dataframe, drop_duplicate_keys, load_csv_to_db
+
+
+@pytest.fixture
+def db_session():
+    """
+    Description:
+        Provide a session on the test database with empty tables for the models under test.
+    
+    Input:
+        None
+    
+    Output:
+        Generator that yields a `sqlalchemy.orm.Session` instance
+    """
+    create_tables()
+    db = SessionLocal()
+    for model_class in (SectionName, Location, Cluster):
+        db.query(model_class).delete()
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
+
+
+def test_dedup_spans_chunk_boundary(tmp_path, db_session):
+    """
+    Description:
+        A duplicate key in a later chunk is dropped instead of failing the whole table load.
+    
+    Input:
+        tmp_path: pytest temporary directory
+        db_session: SQLAlchemy Session
+    
+    Output:
+        None
+    """
+    csv_path = tmp_path / "section_name.csv"
+    csv_path.write_text("section_name,section_id\nA,1\nB,2\nA,1\n")
+
+    inserted = load_csv_to_db(str(csv_path), SectionName, db_session, chunksize=2)
+    db_session.commit()
+
+    assert inserted == 2
+    rows = db_session.query(SectionName.section_name, SectionName.section_id).all()
+    assert sorted(rows) == [("A", 1), ("B", 2)]
+
+
+def test_header_only_csv_loads_nothing(tmp_path, db_session):
+    """
+    Description:
+        A header-only CSV of a deduplicated table ends in the 'No records' path with zero rows.
+    
+    Input:
+        tmp_path: pytest temporary directory
+        db_session: SQLAlchemy Session
+    
+    Output:
+        None
+    """
+    csv_path = tmp_path / "section_name.csv"
+    csv_path.write_text("section_name,section_id\n")
+
+    assert load_csv_to_db(str(csv_path), SectionName, db_session) == 0
+    assert db_session.query(SectionName).count() == 0
+
+
+def test_drop_duplicate_keys_keeps_columns_of_empty_chunk():
+    """
+    Description:
+        Deduplicating an empty chunk keeps its columns, so COPY still gets a column list.
+    
+    Input:
+        None
+    
+    Output:
+        None
+    """
+    empty = pd.DataFrame({"section_name": pd.Series(dtype=object), "section_id": pd.Series(dtype="Int64")})
+
+    result = drop_duplicate_keys(empty, ["section_name", "section_id"], set())
+
+    assert list(result.columns) == ["section_name", "section_id"]
+    assert len(result) == 0
+
+
+def test_failed_table_rolls_back_only_its_savepoint(tmp_path, db_session):
+    """
+    Description:
+        A table that fails mid-load rolls back its own savepoint only; a table loaded earlier
+    in the same transaction survives the final commit.
+    
+    Input:
+        tmp_path: pytest temporary directory
+        db_session: SQLAlchemy Session
+    
+    Output:
+        None
+    """
+    location_path = tmp_path / "location.csv"
+    location_path.write_text("room_id,building_room_name\n1,PAB 1\n2,PAB 2\n")
+    # Third row repeats cluster_id 1 after two rows were already inserted
+    cluster_path = tmp_path / "cluster.csv"
+    cluster_path.write_text("cluster_id,cluster_number,theme\n1,1,Arts\n2,2,Science\n1,3,Duplicate\n")
+
+    assert load_csv_to_db(str(location_path), Location, db_session) == 2
+    with pytest.raises(Exception):
+        load_csv_to_db(str(cluster_path), Cluster, db_session, chunksize=1)
+    db_session.commit()
+
+    check = SessionLocal()
+    try:
+        assert check.query(Location).count() == 2
+        assert check.query(Cluster).count() == 0
+    finally:
+        check.close()
+
+
+def postgres_session():
+    """
+    Description:
+        Build a mock session bound to the PostgreSQL dialect, for exercising the COPY path offline.
+    
+    Input:
+        None
+    
+    Output:
+        tuple: (mock session, mock psycopg2 cursor its connection hands out)
+    """
+    session = MagicMock()
+    session.bind.dialect = postgresql.dialect()
+    cursor = session.connection.return_value.connection.cursor.return_value
+    return session, cursor
+
+
+def test_copy_dataframe_writes_csv_for_copy_from_stdin():
+    """
+    Description:
+        copy_dataframe sends the table's column list and the rows as CSV: NULLs as empty
+    unquoted fields, strings quoted where needed, and nullable integers without a trailing .0.
+    
+    Input:
+        None
+    
+    Output:
+        None
+    """
+    session, cursor = postgres_session()
+    df = pd.DataFrame({
+        "id": pd.array([1, 2], dtype="Int64"),
+        "name": pd.array(['Smith, "Jo"', None], dtype="string"),
+        "bio_url": pd.array([None, "https://example.com"], dtype="string"),
+        "room_id": pd.array([45, None], dtype="Int64"),
+    })
+
+    assert copy_dataframe(session, Instructor, df) == 2
+
+    sql, buffer = cursor.copy_expert.call_args.args
+    assert sql == "COPY instructors (id, name, bio_url, room_id) FROM STDIN WITH (FORMAT csv)"
+    assert buffer.getvalue() == '1,"Smith, ""Jo""",,45\n2,,https://example.com,\n'
+    cursor.close.assert_called_once()
+
+
+def test_copy_dataframe_quotes_mixed_case_columns():
+    """
+    Description:
+        Mixed-case column names (e.g. roomID) are quoted in the COPY column list.
+    
+    Input:
+        None
+    
+    Output:
+        None
+    """
+    session, cursor = postgres_session()
+    df = pd.DataFrame({"dept_name": ["Akian College"], "roomID": pd.array([3], dtype="Int64")})
+
+    copy_dataframe(session, Department, df)
+
+    sql, buffer = cursor.copy_expert.call_args.args
+    assert sql == 'COPY departments (dept_name, "roomID") FROM STDIN WITH (FORMAT csv)'
+    assert buffer.getvalue() == "Akian College,3\n"
+
+
+def test_unknown_csv_columns_are_dropped_with_warning(tmp_path, db_session):
+    """
+    Description:
+        A CSV column the table doesn't define is dropped with a warning, and the row still loads.
+    
+    Input:
+        tmp_path: pytest temporary directory
+        db_session: SQLAlchemy Session
+    
+    Output:
+        None
+    """
+    csv_path = tmp_path / "location.csv"
+    csv_path.write_text("room_id,building_room_name,floor\n1,PAB 1,3\n")
+    warnings = []
+    handler_id = logger.add(warnings.append, level="WARNING", format="{message}")
+    try:
+        inserted = load_csv_to_db(str(csv_path), Location, db_session)
+    finally:
+        logger.remove(handler_id)
+    db_session.commit()
+
+    assert inserted == 1
+    assert db_session.query(Location.room_id, Location.building_room_name).all() == [(1, "PAB 1")]
+    assert any("Ignoring CSV columns not in locations: ['floor']" in message for message in warnings)